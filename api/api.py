@@ -9,7 +9,7 @@ pip install aiofiles
 from __future__ import annotations
 
 import contextlib
-from datetime import datetime
+from datetime import datetime, time
 import logging
 from pathlib import Path
 
@@ -108,15 +108,16 @@ class AnkerSolixApi(AnkerSolixBaseApi):
             elif isAdmin is False and device.get("is_admin") is None:
                 device.update({"is_admin": False})
             calc_capacity = False  # Flag whether capacity may need recalculation
+            calc_battery = False  # Flag whether battery values may need recalculation
             for key, value in devData.items():
                 try:
-                    if key in ["product_code", "device_pn"] and value:
+                    if key in {"product_code", "device_pn"} and value:
                         device.update({"device_pn": str(value)})
                         # try to get type for standalone device from category definitions if not defined yet
-                        if hasattr(SolixDeviceCategory, str(value)):
-                            dev_type = str(
-                                getattr(SolixDeviceCategory, str(value))
-                            ).split("_")
+                        if (
+                            category := getattr(SolixDeviceCategory, str(value), None)
+                        ) is not None:
+                            dev_type = str(category).split("_")
                             if "type" not in device:
                                 device.update({"type": dev_type[0]})
                             # update generation if specified in device type definitions
@@ -144,17 +145,18 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                             )
                     elif key in ["device_sw_version"] and value:
                         device.update({"sw_version": str(value)})
-                    elif key in [
+                    elif key in {
                         # keys with boolean values that should only be updated if value returned
                         "wifi_online",
                         "data_valid",
                         "charge",
                         "auto_upgrade",
                         "is_ota_update",
+                        "ota_forced",
                         "cascaded",
-                    ] and value is not None:
+                    } and value is not None:
                         device.update({key: bool(value)})
-                    elif key in [
+                    elif key in {
                         # keys with string values
                         "wireless_type",
                         "bt_ble_mac",
@@ -167,14 +169,14 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                         "err_code",
                         "ota_version",
                         "bat_charge_power",
-                    ] or (
+                    } or (
                         key
-                        in [
+                        in {
                             # keys with string values that should only updated if value returned
                             "wifi_name",
                             "energy_today",
                             "energy_last_period",
-                        ]
+                        }
                         and value
                     ):
                         device.update({key: str(value)})
@@ -216,7 +218,7 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                     # Add solarbank metrics depending on device type or generation
                     elif (
                         key
-                        in [
+                        in {
                             "solar_power_1",
                             "solar_power_2",
                             "solar_power_3",
@@ -229,7 +231,7 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                             "micro_inverter_low_power_limit",
                             "grid_to_battery_power",
                             "pei_heating_power",
-                        ]
+                        }
                         and value
                     ):
                         if key in getattr(
@@ -243,7 +245,7 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                             device.update({key: int(value)})
                             calc_capacity = True
                     # solarbank info shows the load preset per device, which is identical to device parallel_home_load for 2 solarbanks, or current homeload for single solarbank
-                    elif key in ["set_load_power", "parallel_home_load"] and value:
+                    elif key in {"set_load_power", "parallel_home_load"} and value:
                         # Value may include unit, remove unit to have content consistent
                         device.update({"set_output_power": str(value).replace("W", "")})
                     # The current_home_load from get_device_load always shows the system wide settings made via the schedule
@@ -270,19 +272,15 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                         device.update({key: str(value)})
                         # decode the status into a description
                         description = SolixDeviceStatus.unknown.name
-                        for status in SolixDeviceStatus:
-                            if str(value) == status.value:
-                                description = status.name
-                                break
+                        with contextlib.suppress(ValueError):
+                            description = SolixDeviceStatus(str(value)).name
                         device.update({"status_desc": description})
                     elif key in ["charging_status"]:
                         device.update({key: str(value)})
                         # decode the status into a description
                         description = SolarbankStatus.unknown.name
-                        for status in SolarbankStatus:
-                            if str(value) == status.value:
-                                description = status.name
-                                break
+                        with contextlib.suppress(ValueError):
+                            description = SolarbankStatus(str(value)).name
                         # check if battery has bypass during charge (if output during charge)
                         # This key can be passed separately, make sure the other values are looked up in provided data first, then in device details
                         # NOTE: charging power may be updated after initial device details update
@@ -355,11 +353,11 @@ class AnkerSolixApi(AnkerSolixBaseApi):
 
                         device.update({"charging_status_desc": description})
                     elif (
-                        key in ["power_cutoff", "output_cutoff_data"]
+                        key in {"power_cutoff", "output_cutoff_data"}
                         and str(value).isdigit()
                     ):
                         device.update({key: int(value)})
-                    elif key in ["power_cutoff_data", "ota_children"] and value:
+                    elif key in {"power_cutoff_data", "ota_children"} and value:
                         # list items with value
                         device.update({key: list(value)})
                     elif key in ["fittings"]:
@@ -370,14 +368,21 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                             device[key] = dict(value)
                     elif key in ["solar_info"] and isinstance(value, dict):
                         # remove unnecessary keys from solar_info
-                        keylist = value.keys()
-                        for extra in [
-                            x
-                            for x in ("brand_id", "model_img", "version", "ota_status")
-                            if x in keylist
-                        ]:
-                            value.pop(extra, None)
-                        device.update({key: value})
+                        device.update(
+                            {
+                                key: {
+                                    k: v
+                                    for k, v in value.items()
+                                    if k
+                                    not in {
+                                        "brand_id",
+                                        "model_img",
+                                        "version",
+                                        "ota_status",
+                                    }
+                                }
+                            }
+                        )
                     elif key in ["solarbank_count"] and value:
                         device.update({key: value})
                     # schedule is currently a site wide setting. However, we save this with device details to retain info across site updates
@@ -437,35 +442,25 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                         sys_power = None
                         dev_power = None
                         # set now to new daytime if close to end of day
-                        if now >= datetime.strptime("23:59:58", "%H:%M:%S").time():
-                            now = datetime.strptime("00:00", "%H:%M").time()
+                        if now >= time(23, 59, 58):
+                            now = time(0, 0)
                         if generation >= 2:
                             # Solarbank 2 schedule, weekday starts with 0=Sunday)
                             # datetime isoweekday starts with 1=Monday - 7 = Sunday, strftime('%w') starts also 0 = Sunday
                             # TODO: Implement proper parsing for use_time plan of AC types
                             weekday = int(datetime.now().strftime("%w"))
                             # get rate_plan_name depending on use usage mode_type
+                            mode_name = SolarbankUsageMode.manual.name
+                            with contextlib.suppress(ValueError):
+                                mode_name = SolarbankUsageMode(mode_type).name
                             rate_plan_name = getattr(
-                                SolarbankRatePlan,
-                                next(
-                                    iter(
-                                        [
-                                            item.name
-                                            for item in SolarbankUsageMode
-                                            if item.value == mode_type
-                                        ]
-                                    ),
-                                    SolarbankUsageMode.manual.name,
-                                ),
-                                SolarbankRatePlan.manual,
+                                SolarbankRatePlan, mode_name, SolarbankRatePlan.manual
                             )
                             day_ranges = next(
-                                iter(
-                                    [
-                                        day.get("ranges") or []
-                                        for day in (value.get(rate_plan_name) or [{}])
-                                        if weekday in (day.get("week") or [])
-                                    ]
+                                (
+                                    day.get("ranges") or []
+                                    for day in (value.get(rate_plan_name) or [{}])
+                                    if weekday in (day.get("week") or [])
                                 ),
                                 [],
                             )
@@ -477,9 +472,7 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                                     end_time = slot.get("end_time") or "00:00"
                                     # "24:00" format not supported in strptime
                                     if end_time == "24:00":
-                                        end_time = datetime.strptime(
-                                            "23:59:59", "%H:%M:%S"
-                                        ).time()
+                                        end_time = time(23, 59, 59)
                                     else:
                                         end_time = datetime.strptime(
                                             end_time, "%H:%M"
@@ -525,9 +518,7 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                                     end_time = slot.get("end_time") or "00:00"
                                     # "24:00" format not supported in strptime
                                     if end_time == "24:00":
-                                        end_time = datetime.strptime(
-                                            "23:59:59", "%H:%M:%S"
-                                        ).time()
+                                        end_time = time(23, 59, 59)
                                     else:
                                         end_time = datetime.strptime(
                                             end_time, "%H:%M"
@@ -561,12 +552,10 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                                             "device_power_loads"
                                         ) or [{}]
                                         dev_power = next(
-                                            iter(
-                                                [
-                                                    d.get("power")
-                                                    for d in dev_presets
-                                                    if d.get("device_sn") == sn
-                                                ]
+                                            (
+                                                d.get("power")
+                                                for d in dev_presets
+                                                if d.get("device_sn") == sn
                                             ),
                                             None,
                                         )
@@ -635,78 +624,18 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                         device.update({key: str(value)})
                         # decode the grid status into a description
                         description = SmartmeterStatus.unknown.name
-                        for status in SmartmeterStatus:
-                            if str(value) == status.value:
-                                description = status.name
-                                break
+                        with contextlib.suppress(ValueError):
+                            description = SmartmeterStatus(str(value)).name
                         device.update({"grid_status_desc": description})
-                    elif key in [
+                    elif key in {
                         "photovoltaic_to_grid_power",
                         "grid_to_home_power",
-                    ]:
+                    }:
                         device.update({key: str(value)})
 
-                    # generate extra values when certain conditions are met
-                    if key in ["battery_power"] or calc_capacity:
-                        # generate battery values when soc updated or device name changed or PN is known or exp packs changed
-                        # recalculate only with valid data, otherwise init extra fields with 0
-                        if devData.get("data_valid", True):
-                            if (
-                                not (cap := device.get("battery_capacity"))
-                                or calc_capacity
-                            ):
-                                pn = device.get("device_pn") or ""
-                                if hasattr(SolixDeviceCapacity, pn):
-                                    # get battery capacity from known PNs
-                                    cap = getattr(SolixDeviceCapacity, pn)
-                                elif (
-                                    device.get("type")
-                                    == SolixDeviceType.SOLARBANK.value
-                                ):
-                                    # Derive battery capacity in Wh from latest solarbank name or alias if available
-                                    cap = (
-                                        (
-                                            device.get("name", "")
-                                            or devData.get("device_name", "")
-                                            or device.get("alias", "")
-                                        )
-                                        .replace(" 2", "")
-                                        .replace("Solarbank E", "")
-                                        .replace(" Pro", "")
-                                        .replace(" Plus", "")
-                                    )
-                                # consider battery packs for total device capacity
-                                exp = (
-                                    devData.get("sub_package_num")
-                                    or device.get("sub_package_num")
-                                    or 0
-                                )
-                                if str(cap).isdigit() and str(exp).isdigit():
-                                    cap = int(cap) * (1 + int(exp))
-                            soc = devData.get("battery_power", "") or device.get(
-                                "battery_soc", ""
-                            )
-                            # Calculate remaining energy in Wh and add values
-                            if (
-                                cap
-                                and soc
-                                and str(cap).isdigit()
-                                and str(soc).isdigit()
-                            ):
-                                device.update(
-                                    {
-                                        "battery_capacity": str(cap),
-                                        "battery_energy": str(
-                                            int(int(cap) * int(soc) / 100)
-                                        ),
-                                    }
-                                )
-                        else:
-                            # init calculated fields with 0 if not existing
-                            if "battery_capacity" not in device:
-                                device.update({"battery_capacity": "0"})
-                            if "battery_energy" not in device:
-                                device.update({"battery_energy": "0"})
+                    # flag generation of battery values when soc updated
+                    if key in ["battery_power"]:
+                        calc_battery = True
 
                 except Exception as err:  # pylint: disable=broad-exception-caught  # noqa: BLE001
                     self._logger.error(
@@ -717,6 +646,70 @@ class AnkerSolixApi(AnkerSolixBaseApi):
                         err,
                     )
 
+            # generate extra values once when certain conditions are met
+            if calc_battery or calc_capacity:
+                try:
+                    # generate battery values when soc updated or device name changed or PN is known or exp packs changed
+                    # recalculate only with valid data, otherwise init extra fields with 0
+                    if devData.get("data_valid", True):
+                        if (
+                            not (cap := device.get("battery_capacity"))
+                            or calc_capacity
+                        ):
+                            pn = device.get("device_pn") or ""
+                            if (
+                                pn_cap := getattr(SolixDeviceCapacity, pn, None)
+                            ) is not None:
+                                # get battery capacity from known PNs
+                                cap = pn_cap
+                            elif device.get("type") == SolixDeviceType.SOLARBANK.value:
+                                # Derive battery capacity in Wh from latest solarbank name or alias if available
+                                cap = (
+                                    (
+                                        device.get("name", "")
+                                        or devData.get("device_name", "")
+                                        or device.get("alias", "")
+                                    )
+                                    .replace(" 2", "")
+                                    .replace("Solarbank E", "")
+                                    .replace(" Pro", "")
+                                    .replace(" Plus", "")
+                                )
+                            # consider battery packs for total device capacity
+                            exp = (
+                                devData.get("sub_package_num")
+                                or device.get("sub_package_num")
+                                or 0
+                            )
+                            if str(cap).isdigit() and str(exp).isdigit():
+                                cap = int(cap) * (1 + int(exp))
+                        soc = devData.get("battery_power", "") or device.get(
+                            "battery_soc", ""
+                        )
+                        # Calculate remaining energy in Wh and add values
+                        if cap and soc and str(cap).isdigit() and str(soc).isdigit():
+                            device.update(
+                                {
+                                    "battery_capacity": str(cap),
+                                    "battery_energy": str(
+                                        int(int(cap) * int(soc) / 100)
+                                    ),
+                                }
+                            )
+                    else:
+                        # init calculated fields with 0 if not existing
+                        if "battery_capacity" not in device:
+                            device.update({"battery_capacity": "0"})
+                        if "battery_energy" not in device:
+                            device.update({"battery_energy": "0"})
+                except Exception as err:  # pylint: disable=broad-exception-caught  # noqa: BLE001
+                    self._logger.error(
+                        "%s occurred when updating battery values for device %s: %s",
+                        type(err),
+                        sn,
+                        err,
+                    )
+
             self.devices.update({str(sn): device})
         return sn
 
@@ -960,6 +953,9 @@ class AnkerSolixApi(AnkerSolixBaseApi):
         {"site_id": 'efaca6b5-f4a0-e82e-3b2e-6b9cf90ded8c', "price": 0.325, "site_price_unit": "\u20ac", "site_co2": 0}
         The id must be one of the ids listed with the get_power_cutoff endpoint
         """
+        # fast quit without any Api request if nothing to change
+        if price is None and unit is None and co2 is None:
+            return True
         # First get the old settings if only single setting should be updated
         details = {}
         if siteId in self.sites:
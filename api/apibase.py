@@ -88,27 +88,15 @@ class AnkerSolixBaseApi:
             activeDevices = set()
         # first clear internal site devices cache if active devices are provided
         if activeDevices:
-            rem_devices = [
-                dev
-                for dev in self._site_devices
-                if dev not in (activeDevices | extraDevices)
-            ]
-            for dev in rem_devices:
-                self._site_devices.discard(dev)
+            self._site_devices &= activeDevices | extraDevices
         # Clear device cache to maintain only active and extra devices
-        rem_devices = [
-            dev
-            for dev in self.devices
-            if dev not in (self._site_devices | extraDevices)
-        ]
-        for dev in rem_devices:
+        for dev in self.devices.keys() - (self._site_devices | extraDevices):
             self.devices.pop(dev, None)
 
     def recycleSites(self, activeSites: set | None = None) -> None:
         """Recycle api site cache and remove sites no longer active according provided activeSites."""
         if activeSites and isinstance(activeSites, set):
-            rem_sites = [site for site in self.sites if site not in activeSites]
-            for site in rem_sites:
+            for site in self.sites.keys() - activeSites:
                 self.sites.pop(site, None)
 
     def _update_account(  # noqa: C901
@@ -137,12 +125,12 @@ class AnkerSolixBaseApi:
                 }
             )
         # update extra details and always request counts
-        account_details.update(
-            details
-            | {
-                "requests_last_min": self.apisession.request_count.last_minute(),
-                "requests_last_hour": self.apisession.request_count.last_hour(),
-            }
+        account_details.update(details)
+        account_details["requests_last_min"] = (
+            self.apisession.request_count.last_minute()
+        )
+        account_details["requests_last_hour"] = (
+            self.apisession.request_count.last_hour()
         )
         self.account = account_details
 
@@ -492,6 +480,9 @@ class AnkerSolixBaseApi:
         The main switch must be set True if any device switch is set True. The main switch does not need to be changed to False if no device is True.
         But if main switch is set to False, all devices will automatically be set to False and individual setting is ignored by Api.
         """
+        # fast quit without any Api request if nothing to change
+        if not devices:
+            return True
         # get actual settings
         settings = await self.get_auto_upgrade()
         if (main_switch := settings.get("main_switch")) is None:
@@ -602,16 +593,21 @@ class AnkerSolixBaseApi:
             for dev in data.get("update_infos") or []:
                 if deviceSn := dev.get("device_sn"):
                     need_update = bool(dev.get("need_update"))
-                    is_forced = bool(dev.get("is_forced"))
+                    is_forced = bool(
+                        dev.get("is_forced")
+                        or (dev.get("lastPackage") or {}).get("is_forced")
+                    )
                     children: list = []
                     for child in dev.get("children") or []:
-                        need_update = need_update or bool(child.get("needUpdate"))
-                        is_forced = is_forced or bool(child.get("needUpdate"))
+                        child_update = bool(child.get("needUpdate"))
+                        child_forced = bool(child.get("force_upgrade"))
+                        need_update = need_update or child_update
+                        is_forced = is_forced or child_forced
                         children.append(
                             {
                                 "device_type": child.get("device_type"),
-                                "need_update": bool(child.get("needUpdate")),
-                                "force_upgrade": bool(child.get("force_upgrade")),
+                                "need_update": child_update,
+                                "force_upgrade": child_forced,
                                 "rom_version_name": child.get("rom_version_name"),
                             }
                         )
@@ -619,7 +615,7 @@ class AnkerSolixBaseApi:
                         {
                             "device_sn": deviceSn,
                             "is_ota_update": need_update,
-                            "ota_forced": need_update,
+                            "ota_forced": is_forced,
                             "ota_version": (dev.get("lastPackage") or {}).get("version")
                             or dev.get("current_version")
                             or "",
@@ -18,81 +18,85 @@ API_HEADERS = {
     "Os-Type": "android",
 }
 API_COUNTRIES = {
-    "com": [
-        "DZ",
-        "LB",
-        "SY",
-        "EG",
-        "LY",
-        "TN",
-        "IL",
-        "MA",
-        "JO",
-        "PS",
-        "AR",
-        "AU",
-        "BR",
-        "HK",
-        "IN",
-        "JP",
-        "MX",
-        "NG",
-        "NZ",
-        "RU",
-        "SG",
-        "ZA",
-        "KR",
-        "TW",
-        "US",
-        "CA",
-    ],
-    "eu": [
-        "DE",
-        "BE",
-        "EL",
-        "LT",
-        "PT",
-        "BG",
-        "ES",
-        "LU",
-        "RO",
-        "CZ",
-        "FR",
-        "HU",
-        "SI",
-        "DK",
-        "HR",
-        "MT",
-        "SK",
-        "IT",
-        "NL",
-        "FI",
-        "EE",
-        "CY",
-        "AT",
-        "SE",
-        "IE",
-        "LV",
-        "PL",
-        "UK",
-        "IS",
-        "NO",
-        "LI",
-        "CH",
-        "BA",
-        "ME",
-        "MD",
-        "MK",
-        "GE",
-        "AL",
-        "RS",
-        "TR",
-        "UA",
-        "XK",
-        "AM",
-        "BY",
-        "AZ",
-    ],
+    "com": frozenset(
+        {
+            "DZ",
+            "LB",
+            "SY",
+            "EG",
+            "LY",
+            "TN",
+            "IL",
+            "MA",
+            "JO",
+            "PS",
+            "AR",
+            "AU",
+            "BR",
+            "HK",
+            "IN",
+            "JP",
+            "MX",
+            "NG",
+            "NZ",
+            "RU",
+            "SG",
+            "ZA",
+            "KR",
+            "TW",
+            "US",
+            "CA",
+        }
+    ),
+    "eu": frozenset(
+        {
+            "DE",
+            "BE",
+            "EL",
+            "LT",
+            "PT",
+            "BG",
+            "ES",
+            "LU",
+            "RO",
+            "CZ",
+            "FR",
+            "HU",
+            "SI",
+            "DK",
+            "HR",
+            "MT",
+            "SK",
+            "IT",
+            "NL",
+            "FI",
+            "EE",
+            "CY",
+            "AT",
+            "SE",
+            "IE",
+            "LV",
+            "PL",
+            "UK",
+            "IS",
+            "NO",
+            "LI",
+            "CH",
+            "BA",
+            "ME",
+            "MD",
+            "MK",
+            "GE",
+            "AL",
+            "RS",
+            "TR",
+            "UA",
+            "XK",
+            "AM",
+            "BY",
+            "AZ",
+        }
+    ),
 }  # TODO(2): Expand or update list once ID assignments are wrong or missing
 
 """Following are the Anker Power/Solix Cloud API power_service endpoints known so far. Some are common, others are mainly for balcony power systems"""
@@ -621,51 +625,57 @@ class SolarbankDeviceMetrics:
     """Dataclass for Anker Solarbank metrics which should be tracked in device details cache depending on model type."""
 
     # SOLIX E1600 Solarbank, single MPPT without channel reporting
-    A17C0: ClassVar[set[str]] = set()
+    A17C0: ClassVar[frozenset[str]] = frozenset()
     # SOLIX E1600 Solarbank 2 Pro, with 4 MPPT channel reporting and AC socket
-    A17C1: ClassVar[set[str]] = {
-        "sub_package_num",
-        "solar_power_1",
-        "solar_power_2",
-        "solar_power_3",
-        "solar_power_4",
-        "ac_power",
-        "to_home_load",
-        "pei_heating_power",
-        # Only used by AC model?
-        #"micro_inverter_power",
-        #"micro_inverter_power_limit",
-        #"micro_inverter_low_power_limit",
-        #"other_input_power",
-    }
+    A17C1: ClassVar[frozenset[str]] = frozenset(
+        {
+            "sub_package_num",
+            "solar_power_1",
+            "solar_power_2",
+            "solar_power_3",
+            "solar_power_4",
+            "ac_power",
+            "to_home_load",
+            "pei_heating_power",
+            # Only used by AC model?
+            #"micro_inverter_power",
+            #"micro_inverter_power_limit",
+            #"micro_inverter_low_power_limit",
+            #"other_input_power",
+        }
+    )
     # SOLIX E1600 Solarbank 2 AC, witho 2 MPPT channel and AC socket
-    A17C2: ClassVar[set[str]] = {
-        "sub_package_num",
-        "bat_charge_power",
-        "solar_power_1",
-        "solar_power_2",
-        "ac_power",
-        "to_home_load",
-        "pei_heating_power",
-        "micro_inverter_power",
-        "micro_inverter_power_limit",
-        "micro_inverter_low_power_limit",
-        "grid_to_battery_power",
-        "other_input_power",
-    }
+    A17C2: ClassVar[frozenset[str]] = frozenset(
+        {
+            "sub_package_num",
+            "bat_charge_power",
+            "solar_power_1",
+            "solar_power_2",
+            "ac_power",
+            "to_home_load",
+            "pei_heating_power",
+            "micro_inverter_power",
+            "micro_inverter_power_limit",
+            "micro_inverter_low_power_limit",
+            "grid_to_battery_power",
+            "other_input_power",
+        }
+    )
     # SOLIX E1600 Solarbank 2 Plus, with 2 MPPT
-    A17C3: ClassVar[set[str]] = {
-        "sub_package_num",
-        "solar_power_1",
-        "solar_power_2",
-        "to_home_load",
-        "pei_heating_power",
-        # Only used by AC model?
-        #"micro_inverter_power",
-        #"micro_inverter_power_limit",
-        #"micro_inverter_low_power_limit",
-        #"other_input_power",
-    }
+    A17C3: ClassVar[frozenset[str]] = frozenset(
+        {
+            "sub_package_num",
+            "solar_power_1",
+            "solar_power_2",
+            "to_home_load",
+            "pei_heating_power",
+            # Only used by AC model?
+            #"micro_inverter_power",
+            #"micro_inverter_power_limit",
+            #"micro_inverter_low_power_limit",
+            #"other_input_power",
+        }
+    )
 
 
 @dataclass(frozen=True)
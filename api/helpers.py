@@ -24,23 +24,23 @@ class RequestCounter:
         # limit the counter entries to 1 hour when adding new
         self.recycle()
 
-    def recycle(
-        self, last_time: datetime = datetime.now() - timedelta(hours=1)
-    ) -> None:
+    def recycle(self, last_time: datetime | None = None) -> None:
         """Remove oldest timestamps from beginning of counter until last_time is reached, default is 1 hour ago."""
+        last_time = last_time or datetime.now() - timedelta(hours=1)
         self.elements = [x for x in self.elements if x[0] > last_time]
 
-    def last_minute(self, details: bool = False) -> int | list:
-        """Get number of timestamps or all details for last minute."""
-        last_time = datetime.now() - timedelta(minutes=1)
+    def _since(self, last_time: datetime, details: bool = False) -> int | list:
+        """Get number of timestamps or all details newer than last_time."""
         requests = [x for x in self.elements if x[0] > last_time]
         return requests if details else len(requests)
 
+    def last_minute(self, details: bool = False) -> int | list:
+        """Get number of timestamps or all details for last minute."""
+        return self._since(datetime.now() - timedelta(minutes=1), details=details)
+
     def last_hour(self, details: bool = False) -> int | list:
         """Get number of timestamps or details for last hour."""
-        last_time = datetime.now() - timedelta(hours=1)
-        requests = [x for x in self.elements if x[0] > last_time]
-        return requests if details else len(requests)
+        return self._since(datetime.now() - timedelta(hours=1), details=details)
 
     def get_details(self, last_hour: bool = False) -> str:
         """Get string with details of selected interval."""
@@ -3,6 +3,7 @@
 # flake8: noqa: SLF001
 
 from asyncio import sleep
+from collections import Counter
 import contextlib
 from datetime import datetime, timedelta
 
@@ -70,10 +71,14 @@ async def poll_sites(  # noqa: C901
             siteInfo: dict = mysite.get("site_info", {})
             siteInfo.update(site)
             mysite.update({"type": SolixDeviceType.SYSTEM.value, "site_info": siteInfo})
-            if hasattr(
-                SolixSiteType, item := "t_" + str(siteInfo.get("power_site_type") or "")
-            ):
-                mysite["site_type"] = getattr(SolixSiteType, item)
+            if (
+                site_type := getattr(
+                    SolixSiteType,
+                    "t_" + str(siteInfo.get("power_site_type") or ""),
+                    None,
+                )
+            ) is not None:
+                mysite["site_type"] = site_type
             admin = (
                 siteInfo.get("ms_type", 0) in [0, 1]
             )  # add boolean key to indicate whether user is site admin (ms_type 1 or not known) and can query device details
@@ -159,11 +164,10 @@ async def poll_sites(  # noqa: C901
             sb_total_casc_out_calc = 0
             sb_charges: dict = {}
             sb_list = sb_info.get("solarbank_list") or []
+            # get count of same solarbank types in site once for all solarbanks
+            sb_pn_counts = Counter(sb.get("device_pn") for sb in sb_list)
             # Mark if SB system contains cascaded solarbanks for proper totals calculation
-            if (
-                cascaded_system := len({sb.get("device_pn") for sb in sb_list}) > 1
-                or None
-            ):
+            if cascaded_system := len(sb_pn_counts) > 1 or None:
                 sb_total_output_calc = 0
                 sb_total_solar_calc = 0
                 sb_total_battery_discharge_calc = 0
@@ -183,16 +187,7 @@ async def poll_sites(  # noqa: C901
                 # work around for system and device output presets in dual solarbank 1 setups, which are not set correctly and cannot be queried with load schedule for shared accounts
                 total_preset = str(mysite.get("retain_load", "")).replace("W", "")
                 # get count of same solarbank types in site
-                sb_count = max(
-                    1,
-                    len(
-                        [
-                            sb
-                            for sb in sb_list
-                            if sb.get("device_pn") == solarbank.get("device_pn")
-                        ]
-                    ),
-                )
+                sb_count = max(1, sb_pn_counts[solarbank.get("device_pn")])
                 if (
                     not str(solarbank.get("set_load_power")).isdigit()
                     and total_preset.isdigit()
@@ -375,47 +370,31 @@ async def poll_sites(  # noqa: C901
                     isAdmin=admin,
                 ):
                     api._site_devices.add(sn)
-            smartplug_info = mysite.get("smart_plug_info") or {}
-            for smartplug in smartplug_info.get("smartplug_list") or []:
-                # work around for device_name which is actually the device_alias in scene info
-                if "device_name" in smartplug:
-                    # modify only a copy of the device dict to prevent changing the scene info dict
-                    smartplug = dict(smartplug).copy()
-                    smartplug.update({"alias_name": smartplug.pop("device_name")})
-                if sn := api._update_dev(
-                    smartplug,
-                    devType=SolixDeviceType.SMARTPLUG.value,
-                    siteId=myid,
-                    isAdmin=admin,
-                ):
-                    api._site_devices.add(sn)
-            pps_info = mysite.get("pps_info") or {}
-            for pps in pps_info.get("pps_list") or []:
-                # work around for device_name which is actually the device_alias in scene info
-                if "device_name" in pps:
-                    # modify only a copy of the device dict to prevent changing the scene info dict
-                    pps = dict(pps).copy()
-                    pps.update({"alias_name": pps.pop("device_name")})
-                if sn := api._update_dev(
-                    pps,
-                    devType=SolixDeviceType.PPS.value,
-                    siteId=myid,
-                    isAdmin=admin,
-                ):
-                    api._site_devices.add(sn)
-            for solar in mysite.get("solar_list") or []:
-                # work around for device_name which is actually the device_alias in scene info
-                if "device_name" in solar:
-                    # modify only a copy of the device dict to prevent changing the scene info dict
-                    solar = dict(solar).copy()
-                    solar.update({"alias_name": solar.pop("device_name")})
-                if sn := api._update_dev(
-                    solar,
-                    devType=SolixDeviceType.INVERTER.value,
-                    siteId=myid,
-                    isAdmin=admin,
-                ):
-                    api._site_devices.add(sn)
+            # update device types from scene info lists that don't need extra fields merged
+            for dev_list, dev_type in [
+                (
+                    (mysite.get("smart_plug_info") or {}).get("smartplug_list"),
+                    SolixDeviceType.SMARTPLUG.value,
+                ),
+                (
+                    (mysite.get("pps_info") or {}).get("pps_list"),
+                    SolixDeviceType.PPS.value,
+                ),
+                (mysite.get("solar_list"), SolixDeviceType.INVERTER.value),
+            ]:
+                for dev in dev_list or []:
+                    # work around for device_name which is actually the device_alias in scene info
+                    if "device_name" in dev:
+                        # modify only a copy of the device dict to prevent changing the scene info dict
+                        dev = dict(dev)
+                        dev.update({"alias_name": dev.pop("device_name")})
+                    if sn := api._update_dev(
+                        dev,
+                        devType=dev_type,
+                        siteId=myid,
+                        isAdmin=admin,
+                    ):
+                        api._site_devices.add(sn)
             for powerpanel in mysite.get("powerpanel_list") or []:
                 # work around for device_name which is actually the device_alias in scene info
                 if "device_name" in powerpanel:
@@ -538,7 +517,7 @@ async def poll_device_details(
                 wifi_index = "1"
                 api._update_dev({"device_sn": sn, "wireless_type": wifi_index})
             # check if device_sn found in wifi_list, then it was updated already in the wifi list query, otherwise use old index method for update
-            if wifi_index and not [sn for d in wifi_list if d.get("device_sn") == sn]:
+            if wifi_index and not any(d.get("device_sn") == sn for d in wifi_list):
                 if str(wifi_index).isdigit():
                     wifi_index = int(wifi_index)
                 else:
@@ -8,6 +8,7 @@ pip install aiofiles
 
 from __future__ import annotations
 
+import contextlib
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
@@ -114,10 +115,10 @@ class AnkerSolixPowerpanelApi(AnkerSolixBaseApi):
                     if key in ["product_code", "device_pn"] and value:
                         device.update({"device_pn": str(value)})
                         # try to get type for standalone device from category definitions if not defined yet
-                        if hasattr(SolixDeviceCategory, str(value)):
-                            dev_type = str(
-                                getattr(SolixDeviceCategory, str(value))
-                            ).split("_")
+                        if (
+                            category := getattr(SolixDeviceCategory, str(value), None)
+                        ) is not None:
+                            dev_type = str(category).split("_")
                             if "type" not in device:
                                 device.update({"type": dev_type[0]})
                             # update generation if specified in device type definitions
@@ -129,10 +130,8 @@ class AnkerSolixPowerpanelApi(AnkerSolixBaseApi):
                         device.update({"status": str(value)})
                         # decode the status into a description
                         description = SolixDeviceStatus.unknown.name
-                        for status in SolixDeviceStatus:
-                            if str(value) == status.value:
-                                description = status.name
-                                break
+                        with contextlib.suppress(ValueError):
+                            description = SolixDeviceStatus(str(value)).name
                         device.update({"status_desc": description})
                     elif key in [
                         # Examples for boolean key values
@@ -203,11 +202,14 @@ class AnkerSolixPowerpanelApi(AnkerSolixBaseApi):
                 mysite: dict = self.sites.get(myid, {})
                 site_info: dict = mysite.get("site_info", {})
                 site_info.update(site)
-                if hasattr(
-                    SolixSiteType,
-                    item := "t_" + str(site_info.get("power_site_type") or ""),
-                ):
-                    mysite["site_type"] = getattr(SolixSiteType, item)
+                if (
+                    site_type := getattr(
+                        SolixSiteType,
+                        "t_" + str(site_info.get("power_site_type") or ""),
+                        None,
+                    )
+                ) is not None:
+                    mysite["site_type"] = site_type
                 # check if power panel site type
                 if mysite.get("site_type") == SolixDeviceType.POWERPANEL.value:
                     mysite.update(
@@ -448,13 +450,11 @@ class AnkerSolixPowerpanelApi(AnkerSolixBaseApi):
         """
         # get existing data first from device detals to check if requery must be done
         avg_data = next(
-            iter(
-                [
-                    (dev.get("average_power") or {})
-                    for dev in self.devices.values()
-                    if dev.get("type") == SolixDeviceType.POWERPANEL.value
-                    and dev.get("site_id") == siteId
-                ]
+            (
+                (dev.get("average_power") or {})
+                for dev in self.devices.values()
+                if dev.get("type") == SolixDeviceType.POWERPANEL.value
+                and dev.get("site_id") == siteId
             ),
             {},
         )
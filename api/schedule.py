@@ -3,7 +3,7 @@
 import contextlib
 import copy
 from dataclasses import fields
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime, time, timedelta
 import json
 from pathlib import Path
 
@@ -19,6 +19,11 @@ from .apitypes import (
     SolixParmType,
 )
 
+# valid rate plan names, collected once from the rate plan type definitions
+_RATE_PLAN_NAMES: frozenset[str] = frozenset(
+    field.default for field in fields(SolarbankRatePlan)
+)
+
 
 async def get_device_load(
     self,
@@ -328,22 +333,22 @@ async def set_home_load(  # noqa: C901
     # fast quit if nothing to change
     charge_prio = (
         int(charge_prio)
-        if str(charge_prio).isdigit() or isinstance(charge_prio, int | float)
+        if isinstance(charge_prio, int | float) or str(charge_prio).isdigit()
         else None
     )
     discharge_prio = (
         int(discharge_prio)
-        if str(discharge_prio).isdigit() or isinstance(discharge_prio, int | float)
+        if isinstance(discharge_prio, int | float) or str(discharge_prio).isdigit()
         else None
     )
     preset = (
         int(preset)
-        if str(preset).isdigit() or isinstance(preset, int | float)
+        if isinstance(preset, int | float) or str(preset).isdigit()
         else None
     )
     dev_preset = (
         int(dev_preset)
-        if str(dev_preset).isdigit() or isinstance(dev_preset, int | float)
+        if isinstance(dev_preset, int | float) or str(dev_preset).isdigit()
         else None
     )
     if (
@@ -474,10 +479,10 @@ async def set_home_load(  # noqa: C901
     # update individual values in current slot or insert SolarbankTimeslot and adjust adjacent slots
     if not set_slot:
         now = datetime.now().time().replace(microsecond=0)
-        last_time = datetime.strptime("00:00", "%H:%M").time()
+        last_time = time(0, 0)
         # set now to new daytime if close to end of day to determine which slot to modify
-        if now >= datetime.strptime("23:59:58", "%H:%M:%S").time():
-            now = datetime.strptime("00:00", "%H:%M").time()
+        if now >= time(23, 59, 58):
+            now = time(0, 0)
         next_start = None
         split_slot: dict = {}
         for idx, slot in enumerate(ranges, start=1):
@@ -647,14 +652,11 @@ async def set_home_load(  # noqa: C901
                             and insert_slot.device_load is None
                         ):
                             insert_slot.device_load = next(
-                                iter(
-                                    [
-                                        dev.get("power")
-                                        for dev in insert.get("device_power_loads")
-                                        or []
-                                        if isinstance(dev, dict)
-                                        and dev.get("device_sn") == deviceSn
-                                    ]
+                                (
+                                    dev.get("power")
+                                    for dev in insert.get("device_power_loads") or []
+                                    if isinstance(dev, dict)
+                                    and dev.get("device_sn") == deviceSn
                                 ),
                                 None,
                             )
@@ -790,7 +792,7 @@ async def set_home_load(  # noqa: C901
                         pending_insert = False
                         if insert_slot.end_time.time() >= end_time:
                             # set start of next slot if not end of day
-                            if end_time < datetime.strptime("23:59", "%H:%M").time():
+                            if end_time < time(23, 59):
                                 next_start = insert_slot.end_time.time()
                             last_time = insert_slot.end_time.time()
                             # skip current slot since overlapped by insert slot
@@ -859,14 +861,11 @@ async def set_home_load(  # noqa: C901
                                 and insert_slot.device_load is None
                             ):
                                 insert_slot.device_load = next(
-                                    iter(
-                                        [
-                                            dev.get("power")
-                                            for dev in slot.get("device_power_loads")
-                                            or []
-                                            if isinstance(dev, dict)
-                                            and dev.get("device_sn") == deviceSn
-                                        ]
+                                    (
+                                        dev.get("power")
+                                        for dev in slot.get("device_power_loads") or []
+                                        if isinstance(dev, dict)
+                                        and dev.get("device_sn") == deviceSn
                                     ),
                                     None,
                                 )
@@ -1019,8 +1018,8 @@ async def set_home_load(  # noqa: C901
         if not set_slot:
             # fill set_slot with given parameters
             set_slot = SolarbankTimeslot(
-                start_time=datetime.strptime("00:00", "%H:%M"),
-                end_time=datetime.strptime("23:59", "%H:%M"),
+                start_time=datetime(1900, 1, 1, 0, 0),
+                end_time=datetime(1900, 1, 1, 23, 59),
                 appliance_load=preset,
                 device_load=dev_preset,
                 allow_export=export,
@@ -1195,7 +1194,7 @@ async def set_sb2_home_load(  # noqa: C901
     # fast quit if nothing to change
     preset = (
         int(preset)
-        if str(preset).isdigit() or isinstance(preset, int | float)
+        if isinstance(preset, int | float) or str(preset).isdigit()
         else None
     )
     # Allow automatic modes only when smart meter or smart plugs available in site
@@ -1276,29 +1275,14 @@ async def set_sb2_home_load(  # noqa: C901
         usage_mode = schedule.get("mode_type")
 
     # get validated rate plan name from optional plan_name parameter or use plan name for given/active user mode, default to custom rate plan name
-    rate_plan_name = next(
-        iter(
-            [
-                field.default
-                for field in fields(SolarbankRatePlan)
-                if field.default == plan_name
-            ]
-        ),
+    mode_name = SolarbankUsageMode.manual.name
+    with contextlib.suppress(ValueError):
+        mode_name = SolarbankUsageMode(usage_mode).name
+    rate_plan_name = (
+        plan_name
+        if plan_name in _RATE_PLAN_NAMES
         # default name if plan_name not provided or invalid
-        getattr(
-            SolarbankRatePlan,
-            next(
-                iter(
-                    [
-                        item.name
-                        for item in SolarbankUsageMode
-                        if item.value == usage_mode
-                    ]
-                ),
-                SolarbankUsageMode.manual.name,
-            ),
-            SolarbankRatePlan.manual,
-        ),
+        else getattr(SolarbankRatePlan, mode_name, SolarbankRatePlan.manual)
     )
     rate_plan = schedule.get(rate_plan_name) or []
     new_rate_plan = []
@@ -1410,10 +1394,10 @@ async def set_sb2_home_load(  # noqa: C901
     # update individual values in current slot or insert SolarbankTimeslot and adjust adjacent slots
     if preset is not None or pending_insert:
         now = datetime.now().time().replace(microsecond=0)
-        last_time = datetime.strptime("00:00", "%H:%M").time()
+        last_time = time(0, 0)
         # set now to new daytime if close to end of day to determine which slot to modify
-        if now >= datetime.strptime("23:59:58", "%H:%M:%S").time():
-            now = datetime.strptime("00:00", "%H:%M").time()
+        if now >= time(23, 59, 58):
+            now = time(0, 0)
         next_start = None
         split_slot: dict = {}
         for idx, slot in enumerate(ranges, start=1):
@@ -1529,7 +1513,7 @@ async def set_sb2_home_load(  # noqa: C901
                         pending_insert = False
                         if insert_slot.end_time.time() >= end_time:
                             # set start of next slot if not end of day
-                            if end_time < datetime.strptime("23:59", "%H:%M").time():
+                            if end_time < time(23, 59):
                                 next_start = insert_slot.end_time.time()
                             last_time = insert_slot.end_time.time()
                             # skip current slot since overlapped by insert slot
@@ -1658,8 +1642,8 @@ async def set_sb2_home_load(  # noqa: C901
         if not set_slot:
             # fill set_slot with given parameters
             set_slot = Solarbank2Timeslot(
-                start_time=datetime.strptime("00:00", "%H:%M"),
-                end_time=datetime.strptime("23:59", "%H:%M"),
+                start_time=datetime(1900, 1, 1, 0, 0),
+                end_time=datetime(1900, 1, 1, 23, 59),
                 appliance_load=preset,
             )
         slot = {
@@ -1,6 +1,6 @@
 """Anker Power/Solix Cloud API class to handle a client connection session for an account."""
 
-from asyncio import sleep
+from asyncio import get_running_loop, sleep
 from base64 import b64encode
 import contextlib
 from datetime import datetime
@@ -51,6 +51,7 @@ class AnkerSolixClientSession:
         for region, countries in API_COUNTRIES.items():
             if self._countryId in countries:
                 self._api_base = API_SERVERS.get(region)
+                break
         # default to EU server
         if not self._api_base:
             self._api_base = API_SERVERS.get("eu")
@@ -58,30 +59,32 @@ class AnkerSolixClientSession:
         self._password: str = password
         self._session: ClientSession = websession
         self._loggedIn: bool = False
-        self._testdir: str = str(
-            Path(Path(__file__).parent) / ".." / "examples" / "example1"
-        )
+        self._testdir: str = str(Path(__file__).parent / ".." / "examples" / "example1")
 
         # Flag for retry after any token error
         self._retry_attempt: bool = False
         # ensure folder for authentication caching exists
-        Path(Path(Path(__file__).parent) / "authcache").mkdir(
-            parents=True, exist_ok=True
-        )
+        (Path(__file__).parent / "authcache").mkdir(parents=True, exist_ok=True)
         # filename for authentication cache
-        self._authFile: str = str(
-            Path(Path(__file__).parent) / "authcache" / f"{email}.json"
-        )
+        self._authFile: str = str(Path(__file__).parent / "authcache" / f"{email}.json")
         self._authFileTime: float = 0
 
         # Timezone format: 'GMT+01:00'
         self._timezone: str = getTimezoneGMTString()
+        # Session request headers prepared once from the shared template, which must not be modified
+        self._headers: dict = API_HEADERS.copy()
+        if self._countryId:
+            self._headers["Country"] = self._countryId
+        if self._timezone:
+            self._headers["Timezone"] = self._timezone
         self._gtoken: str | None = None
         self._token: str | None = None
         self._token_expiration: datetime | None = None
         self._login_response: dict = {}
         self._request_delay: float = SolixDefaults.REQUEST_DELAY_DEF
         self._last_request_time: datetime | None = None
+        # monotonic clock of last request for delay calculation, not affected by system clock changes
+        self._last_request_mono: float | None = None
 
         # Define Encryption for password, using ECDH asymmetric key exchange for shared secret calculation, which must be used to encrypt the password using AES-256-CBC with seed of 16
         # uncompressed public key from EU Anker server in the format 04 [32 byte x value] [32 byte y value]
@@ -184,14 +187,18 @@ class AnkerSolixClientSession:
             )
         else:
             delay = self._request_delay
-        if isinstance(self._last_request_time, datetime):
+        if self._last_request_mono is not None:
             await sleep(
-                max(
-                    0,
-                    delay - (datetime.now() - self._last_request_time).total_seconds(),
-                )
+                max(0, delay - (systime.monotonic() - self._last_request_mono))
             )
 
+    def _authFileMtime(self) -> float | None:
+        """Get the modification time of the authentication cache file with a single stat call, None if the file does not exist."""
+        try:
+            return Path(self._authFile).stat().st_mtime
+        except OSError:
+            return None
+
     async def async_authenticate(self, restart: bool = False) -> bool:
         """Authenticate with server and get an access token. If restart is not enforced, cached login data may be used to obtain previous token."""
         if restart:
@@ -209,15 +216,16 @@ class AnkerSolixClientSession:
         if Path(self._authFile).is_file():
             data = await self.loadFromFile(self._authFile)
             self._authFileTime = Path(self._authFile).stat().st_mtime
-            self._logger.debug(
-                "Cached Login for %s from %s:",
-                self.mask_values(self._email),
-                datetime.fromtimestamp(self._authFileTime).isoformat(),
-            )
-            self._logger.debug(
-                "%s",
-                self.mask_values(data, "user_id", "auth_token", "email", "geo_key"),
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Cached Login for %s from %s:",
+                    self.mask_values(self._email),
+                    datetime.fromtimestamp(self._authFileTime).isoformat(),
+                )
+                self._logger.debug(
+                    "%s",
+                    self.mask_values(data, "user_id", "auth_token", "email", "geo_key"),
+                )
             # clear retry attempt to allow retry for authentication refresh
             self._retry_attempt = False
         else:
@@ -248,10 +256,11 @@ class AnkerSolixClientSession:
                 },
             )
             data = auth_resp.get("data", {})
-            self._logger.debug(
-                "Login Response: %s",
-                self.mask_values(data, "user_id", "auth_token", "email", "geo_key"),
-            )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Login Response: %s",
+                    self.mask_values(data, "user_id", "auth_token", "email", "geo_key"),
+                )
             self._loggedIn = True
             # Cache login response in file for reuse
             async with aiofiles.open(self._authFile, "w", encoding="utf-8") as authfile:
@@ -290,8 +299,6 @@ class AnkerSolixClientSession:
         """Handle all requests to the API. This is also called recursively by login requests if necessary."""
         if not headers:
             headers = {}
-        if not json:
-            data = {}
         if (
             self._token_expiration
             and (self._token_expiration - datetime.now()).total_seconds() < 60
@@ -302,19 +309,14 @@ class AnkerSolixClientSession:
         if endpoint != API_LOGIN and (
             not self._loggedIn
             or (
-                Path(self._authFile).is_file()
-                and self._authFileTime != Path(self._authFile).stat().st_mtime
+                (mtime := self._authFileMtime()) is not None
+                and self._authFileTime != mtime
             )
         ):
             await self.async_authenticate()
 
         url: str = f"{self._api_base}/{endpoint}"
-        mergedHeaders = API_HEADERS
-        mergedHeaders.update(headers)
-        if self._countryId:
-            mergedHeaders.update({"Country": self._countryId})
-        if self._timezone:
-            mergedHeaders.update({"Timezone": self._timezone})
+        mergedHeaders = self._headers | headers
         if self._token:
             mergedHeaders.update({"x-auth-token": self._token})
             mergedHeaders.update({"gtoken": self._gtoken})
@@ -340,10 +342,12 @@ class AnkerSolixClientSession:
             # })
 
         self._logger.debug("Request Url: %s %s", method.upper(), url)
-        self._logger.debug(
-            "Request Headers: %s",
-            self.mask_values(mergedHeaders, "x-auth-token", "gtoken"),
-        )
+        # mask a copy of the headers only if it will be logged
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Request Headers: %s",
+                self.mask_values(mergedHeaders, "x-auth-token", "gtoken"),
+            )
         if endpoint in [
             API_LOGIN,
             API_ENDPOINTS["get_token_by_userid"],
@@ -365,11 +369,13 @@ class AnkerSolixClientSession:
         self._logger.debug("Request Body: %s", body_text)
         # enforce configured delay between any subsequent request
         await self._wait_delay()
+        data: dict = {}
         async with self._session.request(
             method, url, headers=mergedHeaders, json=json
         ) as resp:
             try:
                 self._last_request_time = datetime.now()
+                self._last_request_mono = systime.monotonic()
                 self.request_count.add(
                     request_time=self._last_request_time,
                     request_info=(f"{method.upper()} {url} {body_text}").strip(),
@@ -381,7 +387,6 @@ class AnkerSolixClientSession:
                 self._logger.debug("Response Headers: %s", resp.headers)
                 # get first the body text for usage in error detail logging if necessary
                 body_text = await resp.text()
-                data = {}
                 resp.raise_for_status()  # any response status >= 400
                 if (data := await resp.json(content_type=None)) and self.encrypt_body:
                     # TODO(#70): Test and Support optional encryption for body
@@ -394,12 +399,13 @@ class AnkerSolixClientSession:
                     raise ClientError(f"No data response while requesting {endpoint}")  # noqa: TRY301
 
                 if endpoint == API_LOGIN:
-                    self._logger.debug(
-                        "Response Data: %s",
-                        self.mask_values(
-                            data, "user_id", "auth_token", "email", "geo_key"
-                        ),
-                    )
+                    if self._logger.isEnabledFor(logging.DEBUG):
+                        self._logger.debug(
+                            "Response Data: %s",
+                            self.mask_values(
+                                data, "user_id", "auth_token", "email", "geo_key"
+                            ),
+                        )
                 else:
                     self._logger.debug("Response Data: %s", data)
                     # reset retry flag only when valid token received and not another login request
@@ -419,9 +425,9 @@ class AnkerSolixClientSession:
                 # Prepare data dict for Api error lookup
                 if not data:
                     data = {}
-                if not hasattr(data, "code"):
+                if "code" not in data:
                     data["code"] = resp.status
-                if not hasattr(data, "msg"):
+                if "msg" not in data:
                     data["msg"] = body_text
                 if resp.status in [401, 403]:
                     # Unauthorized or forbidden request
@@ -505,19 +511,27 @@ class AnkerSolixClientSession:
             )
         else:
             masked_filename = filename
+
+        def read_json() -> dict:
+            """Read and parse the file in one go."""
+            with Path(filename).open(encoding="utf-8") as file:
+                return json.load(file)
+
         try:
             if Path(filename).is_file():
-                async with aiofiles.open(filename, encoding="utf-8") as file:
-                    data = json.loads(await file.read())
-                    self._logger.debug("Loaded JSON from file %s:", masked_filename)
+                # open, read and parse the file with a single executor job instead of one per file operation
+                data = await get_running_loop().run_in_executor(None, read_json)
+                self._logger.debug("Loaded JSON from file %s:", masked_filename)
+                # mask a copy of the data only if it will be logged
+                if self._logger.isEnabledFor(logging.DEBUG):
                     self._logger.debug(
                         "Data: %s",
                         self.mask_values(
                             data, "user_id", "auth_token", "email", "geo_key", "token"
                         ),
                     )
-                    self.request_count.add(request_info=f"LOAD {masked_filename}")
-                    return data
+                self.request_count.add(request_info=f"LOAD {masked_filename}")
+                return data
         except OSError as err:
             self._logger.error(
                 "ERROR: Failed to load JSON from file %s", masked_filename
@@ -536,11 +550,19 @@ class AnkerSolixClientSession:
             masked_filename = filename
         if not data:
             data = {}
+
+        def write_json(content: str) -> None:
+            """Write the serialized data with a single write call."""
+            with Path(filename).open("w", encoding="utf-8") as file:
+                file.write(content)
+
         try:
-            async with aiofiles.open(filename, "w", encoding="utf-8") as file:
-                await file.write(json.dumps(data, indent=2))
-                self._logger.debug("Saved JSON to file %s:", masked_filename)
-                return True
+            # serialize on the loop since data may be changed while the executor job runs
+            content = json.dumps(data, indent=2)
+            # open and write the file with a single executor job instead of one per file operation
+            await get_running_loop().run_in_executor(None, write_json, content)
+            self._logger.debug("Saved JSON to file %s:", masked_filename)
+            return True
         except OSError as err:
             self._logger.error("ERROR: Failed to save JSON to file %s", masked_filename)
             self._logger.error(err)
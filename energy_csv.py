@@ -52,7 +52,8 @@ async def main() -> bool:
                 return False
             CONSOLE.info("OK")
             CONSOLE.info("\nSites: %s", len(myapi.sites))
-            CONSOLE.debug(json.dumps(myapi.sites, indent=2))
+            if CONSOLE.isEnabledFor(logging.DEBUG):
+                CONSOLE.debug(json.dumps(myapi.sites, indent=2))
 
             for site_id, site in myapi.sites.items():
                 site_name = (site.get("site_info") or {}).get("site_name") or ""
@@ -125,7 +126,8 @@ async def main() -> bool:
                             api.SolixDeviceType.SMARTPLUG.value,
                         },
                     )
-                CONSOLE.debug(json.dumps(data, indent=2))
+                if CONSOLE.isEnabledFor(logging.DEBUG):
+                    CONSOLE.debug(json.dumps(data, indent=2))
                 # Write csv file
                 if len(data) > 0:
                     with Path.open(  # noqa: ASYNC230
@@ -145,7 +147,7 @@ async def main() -> bool:
                     )
                     return False
                 #CONSOLE.info(myapi.apisession.request_count.get_details())
-                CONSOLE.info(f"Api Requests: {myapi.request_count}")
+                CONSOLE.info("Api Requests: %s", myapi.request_count)
             return True
 
     except Exception as err:  # pylint: disable=broad-exception-caught  # noqa: BLE001
@@ -550,7 +550,8 @@ async def main() -> (  # noqa: C901 # pylint: disable=too-many-locals,too-many-b
                 else:
                     CONSOLE.info("Api Requests: %s", myapi.request_count)
                     # CONSOLE.info(myapi.request_count.get_details(last_hour=True))
-                    CONSOLE.debug(json.dumps(myapi.devices, indent=2))
+                    if CONSOLE.isEnabledFor(logging.DEBUG):
+                        CONSOLE.debug(json.dumps(myapi.devices, indent=2))
                     for sec in range(REFRESH):
                         now = datetime.now().astimezone()
                         if sys.stdin is sys.__stdin__:
@@ -559,13 +560,16 @@ async def main() -> (  # noqa: C901 # pylint: disable=too-many-locals,too-many-b
                                 end="\r",
                                 flush=True,
                             )
-                        elif sec == 0:
+                        else:
                             # IDLE may be used and does not support cursor placement, skip time progress display
                             print(  # noqa: T201
                                 f"Site refresh: {int((next_refr - now).total_seconds()):>3} sec,  Device details refresh: {int((next_dev_refr - now).total_seconds()):>3} sec  (CTRL-C to abort)",
                                 end="",
                                 flush=True,
                             )
+                            # no progress display, wait for the whole refresh interval at once
+                            await asyncio.sleep(REFRESH - sec)
+                            break
                         await asyncio.sleep(1)
             return False
 
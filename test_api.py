@@ -208,7 +208,7 @@ async def testAPI_ENDPOINTS(myapi: api.AnkerSolixApi) -> None:  # noqa: D103
 
 
 async def test_api_from_json_files(myapi: api.AnkerSolixApi) -> None:  # noqa: D103
-    myapi.testDir(Path(Path(__file__).parent) / "examples" / JSONFOLDER)
+    myapi.testDir(Path(__file__).parent / "examples" / JSONFOLDER)
     await myapi.update_sites(fromFile=True)
     await myapi.update_site_details(fromFile=True)
     await myapi.update_device_details(fromFile=True)